@@ -7,11 +7,25 @@ to ./outputs.
 """
 
 import argparse
+import hashlib
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless; figures are rendered in worker processes
 import matplotlib.pyplot as plt
 
+try:  # optional fast CSV reader/writer
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
 # Defaults
 CSV_PATH = "EVALUATION_SCORES.csv"
 DATE_COL = "ObservationDateTime"
@@ -23,6 +37,11 @@ ETYPE_COL = "EvaluationType"
 
 OUT_FIGS = Path("figures_evals")
 OUT_DATA = Path("outputs")
+PNG_OPTS = {"compress_level": 1}  # fast zlib level; files are a little larger
+# Below this many rows the four plots take ~1s serially, about what starting
+# a worker pool costs, so they are rendered in-process instead.
+PLOT_POOL_MIN_ROWS = 2_000_000
+CACHE_VERSION = 1  # bump whenever load_clean's output changes
 
 
 def parse_args():
@@ -43,52 +62,131 @@ def ensure_dirs():
     OUT_DATA.mkdir(parents=True, exist_ok=True)
 
 
-def load_clean(path, date_col, score_col, schoolyear_col, school_year_filter=None):
-    df = pd.read_csv(path)
+def read_columns(path, wanted, text_cols=()):
+    """Read only the `wanted` columns (matched after stripping header whitespace).
+
+    `text_cols` are read as plain strings so pyarrow does not infer their types.
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [c for c in header if str(c).strip() in wanted]
+    if HAVE_PYARROW and os.path.isfile(path):
+        # Typed up front: left to pyarrow's inference, offset timestamps would come
+        # back converted to UTC before pandas ever sees them.
+        convert = pacsv.ConvertOptions(
+            include_columns=usecols, strings_can_be_null=True,
+            column_types={c: pa.string() for c in usecols if str(c).strip() in text_cols})
+        df = pacsv.read_csv(path, convert_options=convert).to_pandas()
+    else:
+        df = pd.read_csv(path, usecols=usecols)
     df.columns = [str(c).strip() for c in df.columns]
+    return df
+
+
+def write_csv(df, path):
+    """Write `df` without its index, via pyarrow when available."""
+    if HAVE_PYARROW:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    else:
+        df.to_csv(path, index=False)
+
+
+def load_clean(path, date_col, score_col, schoolyear_col, school_year_filter=None,
+               extra_cols=()):
+    df = read_columns(path, {date_col, score_col, schoolyear_col, *extra_cols},
+                      text_cols={date_col})
     if date_col not in df.columns or score_col not in df.columns:
         raise ValueError(f"CSV must include {date_col!r} and {score_col!r}.")
     df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-    df[score_col] = pd.to_numeric(df[score_col], errors="coerce")
+    df[score_col] = pd.to_numeric(df[score_col], errors="coerce").astype("float32")
     df = df.dropna(subset=[date_col, score_col]).copy()
     if school_year_filter and schoolyear_col in df.columns:
         df = df[df[schoolyear_col].astype(str) == str(school_year_filter)].copy()
-    df["Month"] = df[date_col].dt.to_period("M").astype(str)
-    df["MonthStart"] = pd.to_datetime(df["Month"] + "-01")
+    # Label columns become categoricals so groupbys run on integer codes.
+    for col in (schoolyear_col, *extra_cols):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    dates = df[date_col]
+    if dates.dt.tz is not None:  # bucket by local wall time, not UTC
+        dates = dates.dt.tz_localize(None)
+    df["MonthStart"] = dates.to_numpy().astype("datetime64[M]").astype("datetime64[ns]")
+    return df
+
+
+def load_clean_cached(path, date_col, score_col, schoolyear_col, school_year_filter=None,
+                      extra_cols=()):
+    """`load_clean`, reusing a Parquet copy in OUT_DATA while the CSV and arguments match."""
+    if not HAVE_PYARROW or not os.path.isfile(path):  # e.g. a URL
+        return load_clean(path, date_col, score_col, schoolyear_col, school_year_filter,
+                          extra_cols)
+    # File name: .cache_<arguments>_<CSV version>.parquet
+    st = Path(path).stat()
+    args_key = repr((CACHE_VERSION, str(Path(path).resolve()), date_col, score_col,
+                     schoolyear_col, school_year_filter, tuple(extra_cols)))
+    prefix = f".cache_{hashlib.sha1(args_key.encode()).hexdigest()[:16]}_"
+    version = hashlib.sha1(repr((st.st_mtime_ns, st.st_size)).encode()).hexdigest()[:16]
+    cache = OUT_DATA / f"{prefix}{version}.parquet"
+    if cache.exists():
+        try:
+            return pd.read_parquet(cache, engine="pyarrow")
+        except (OSError, ValueError):  # truncated or corrupt; rebuild it below
+            pass
+    df = load_clean(path, date_col, score_col, schoolyear_col, school_year_filter, extra_cols)
+    # Write to a temp file and rename so an interrupted run never leaves a partial
+    # cache, then drop caches (and leftover temp files) for older CSV versions.
+    fd, tmp = tempfile.mkstemp(dir=OUT_DATA, prefix=prefix, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp, engine="pyarrow", compression="zstd")
+        os.replace(tmp, cache)
+    except OSError:  # the cache is only an optimisation
+        Path(tmp).unlink(missing_ok=True)
+        return df
+    for old in OUT_DATA.glob(f"{prefix}*"):
+        if old != cache:
+            old.unlink(missing_ok=True)
     return df
 
 
+# (prefix, substring or None, group label); first match wins.
+EVAL_GROUPS = [
+    ("Teacher", "Announced", "Teacher (Announced)"),
+    ("Teacher", "Unannounced", "Teacher (Unannounced)"),
+    ("Teacher", "Domain 4", "Teacher (Domain 4)"),
+    ("Counselor", "Announced", "Counselor (Announced)"),
+    ("Counselor", "Unannounced", "Counselor (Unannounced)"),
+    ("Counselor", "Domain 4", "Counselor (Domain 4)"),
+    ("Nurse", "Announced", "Nurse (Announced)"),
+    ("Nurse", "Unannounced", "Nurse (Unannounced)"),
+    ("Nurse", "Domain 4", "Nurse (Domain 4)"),
+    ("Child Study Team", None, "Child Study Team"),
+    ("Related Services", None, "Related Services"),
+    ("Instructional Assistant", None, "Instructional Assistant"),
+    ("Administrators", None, "Administrator"),
+    ("Media", None, "Media Specialist"),
+]
+
+
 def make_eval_group(df, etype_col):
-    """Collapse EvaluationType to compact groups."""
-    g = df.copy()
-    g["EvalGroup"] = g[etype_col].astype(str).replace({
-        r"^Teacher.*Announced.*$": "Teacher (Announced)",
-        r"^Teacher.*Unannounced.*$": "Teacher (Unannounced)",
-        r"^Teacher.*Domain 4.*$": "Teacher (Domain 4)",
-        r"^Counselor.*Announced.*$": "Counselor (Announced)",
-        r"^Counselor.*Unannounced.*$": "Counselor (Unannounced)",
-        r"^Counselor.*Domain 4.*$": "Counselor (Domain 4)",
-        r"^Nurse.*Announced.*$": "Nurse (Announced)",
-        r"^Nurse.*Unannounced.*$": "Nurse (Unannounced)",
-        r"^Nurse.*Domain 4.*$": "Nurse (Domain 4)",
-        r"^Child Study Team.*$": "Child Study Team",
-        r"^Related Services.*$": "Related Services",
-        r"^Instructional Assistant.*$": "Instructional Assistant",
-        r"^Administrators.*$": "Administrator",
-        r"^Media.*$": "Media Specialist",
-    }, regex=True)
-    g["EvalGroup"] = g["EvalGroup"].fillna(g[etype_col].astype(str))
-    return g
+    """Collapse EvaluationType to compact groups; returns one label per row."""
+    # Classify each distinct type once; blanks (code -1) become "nan" as before.
+    etype = df[etype_col].astype("category")
+    s = pd.Series([*etype.cat.categories.astype(object).astype(str), "nan"], dtype=object)
+    prefixes = {prefix: s.str.startswith(prefix).to_numpy()
+                for prefix, _, _ in EVAL_GROUPS}
+    conds = [prefixes[prefix] if needle is None
+             else prefixes[prefix] & s.str.contains(needle, regex=False).to_numpy()
+             for prefix, needle, _ in EVAL_GROUPS]
+    labels = np.select(conds, [label for _, _, label in EVAL_GROUPS], default=s.to_numpy())
+    return pd.Categorical(labels[etype.cat.codes.to_numpy()])
 
 
 def plot_hist(df, score_col, tag=""):
-    s = df[score_col].dropna()
-    mean, median, std, n = s.mean(), s.median(), s.std(), len(s)
-    fig, ax = plt.subplots(figsize=(10, 5))
-    counts, _, patches = ax.hist(s, bins=20, edgecolor="white", linewidth=0.5)
-    cm = plt.cm.viridis
-    for c, p in zip(counts, patches):
-        plt.setp(p, "facecolor", cm(c / max(counts)))
+    s = df[score_col].to_numpy()  # load_clean already dropped null scores
+    mean, median, std, n = s.mean(), np.median(s), s.std(ddof=1), len(s)
+    fig, ax = plt.subplots(figsize=(10, 5), layout="constrained")
+    counts, edges = np.histogram(s, bins=20)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge",
+           color=plt.cm.viridis(counts / counts.max()), edgecolor="white", linewidth=0.5)
     ax.axvline(mean, color="red", linestyle="--", linewidth=2, label=f"Mean = {mean:.2f}")
     ax.axvline(median, color="orange", linestyle=":", linewidth=2, label=f"Median = {median:.2f}")
     ax.set_title(f"Distribution of Evaluation Scores {tag}", fontsize=13, weight="bold")
@@ -97,104 +195,149 @@ def plot_hist(df, score_col, tag=""):
             transform=ax.transAxes, ha="right", va="top", fontsize=9,
             bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
     ax.legend()
-    fig.tight_layout()
-    fig.savefig(OUT_FIGS / f"01_hist_scores{tag}.png", dpi=150)
+    fig.savefig(OUT_FIGS / f"01_hist_scores{tag}.png", dpi=150, pil_kwargs=PNG_OPTS)
     plt.close(fig)
 
 
-def plot_box_by_type(df, score_col, etype_col, tag="", min_n=10):
-    gdf = make_eval_group(df, etype_col)
-    stats = (gdf.groupby("EvalGroup")[score_col]
-                .agg(median="median", n="count")
-                .reset_index())
-    stats = stats[stats["n"] >= min_n].sort_values("median")
-    order = stats["EvalGroup"].tolist()
-    data = [gdf.loc[gdf["EvalGroup"] == label, score_col].dropna().values for label in order]
-
-    fig = plt.figure(figsize=(12, max(6, int(len(order) * 0.45))))
-    ax = plt.gca()
-    plt.boxplot(data, vert=False, labels=order, showmeans=True)
+def box_stats(a, label, whis=1.5):
+    """Box plot statistics for `ax.bxp` (Tukey whiskers, like `plt.boxplot`)."""
+    q1, med, q3 = np.percentile(a, [25, 50, 75])
+    iqr = q3 - q1
+    # Whiskers reach the most extreme points within whis*IQR, but never into the box.
+    lo_ok, hi_ok = a[a >= q1 - whis * iqr], a[a <= q3 + whis * iqr]
+    lo = lo_ok.min() if len(lo_ok) and lo_ok.min() <= q1 else q1
+    hi = hi_ok.max() if len(hi_ok) and hi_ok.max() >= q3 else q3
+    return {"label": label, "mean": a.mean(), "med": med, "q1": q1, "q3": q3,
+            "whislo": lo, "whishi": hi, "fliers": a[(a < lo) | (a > hi)]}
+
+
+def plot_box_by_type(gdf, score_col, tag="", min_n=10):
+    stats = (gdf.groupby("EvalGroup", observed=True)[score_col]
+                .agg(["count", "mean", "median", "std"]))
+    stats = stats[stats["count"] >= min_n].sort_values("median")
+    order = stats.index.tolist()
+    groups = {label: scores.to_numpy() for label, scores
+              in gdf.groupby("EvalGroup", observed=True, sort=False)[score_col]}
+    bxp_stats = [box_stats(groups[label], label) for label in order]
+
+    fig, ax = plt.subplots(figsize=(12, max(6, int(len(order) * 0.45))), layout="constrained")
+    ax.bxp(bxp_stats, vert=False, showmeans=True)
     ax.set_title(f"Scores by Evaluation Type (Grouped) {tag}")
     ax.set_xlabel("Score"); ax.set_ylabel("Evaluation Type (Grouped)")
     ax.grid(axis="x", alpha=0.3)
 
     x_right = ax.get_xlim()[1]
-    for y_idx, label in enumerate(order, start=1):
-        n = int(stats.loc[stats["EvalGroup"] == label, "n"].iloc[0])
-        ax.text(x_right, y_idx, f"  n={n}", va="center", fontsize=9)
+    for y, n in zip(np.arange(1, len(order) + 1), stats["count"].to_numpy()):
+        ax.text(x_right, y, f"  n={n}", va="center", fontsize=9)
 
-    fig.tight_layout()
-    fig.savefig(OUT_FIGS / f"02_box_by_type{tag}.png", dpi=150)
+    fig.savefig(OUT_FIGS / f"02_box_by_type{tag}.png", dpi=150, pil_kwargs=PNG_OPTS)
     plt.close(fig)
 
-    (gdf.groupby("EvalGroup")[score_col]
-        .agg(["count", "mean", "median", "std"])
-        .loc[order]).to_csv(OUT_DATA / f"type_means_grouped{tag}.csv")
+    write_csv(stats.reset_index(), OUT_DATA / f"type_means_grouped{tag}.csv")
 
 
 def plot_monthly_trend(df, date_col, score_col, tag=""):
-    monthly = (df.groupby(["Month", "MonthStart"], as_index=False)[score_col]
-                 .mean()
-                 .sort_values("MonthStart"))
-    fig = plt.figure(figsize=(11, 5))
-    plt.plot(monthly["MonthStart"], monthly[score_col], marker="o", linewidth=2)
-    plt.title(f"Average Score by Month {tag}")
-    plt.xlabel("Date"); plt.ylabel("Average Score")
-    fig.tight_layout()
-    fig.savefig(OUT_FIGS / f"03_monthly_trend{tag}.png", dpi=150)
+    months = df["MonthStart"].to_numpy().astype("datetime64[M]").astype(np.int64)
+    m0 = months.min()
+    idx = months - m0
+    counts = np.bincount(idx)
+    sums = np.bincount(idx, weights=df[score_col].to_numpy())
+    seen = counts > 0  # months without observations are skipped, as groupby would
+    month_start = np.arange(m0, m0 + len(counts)).astype("datetime64[M]")[seen]
+    means = sums[seen] / counts[seen]
+
+    fig, ax = plt.subplots(figsize=(11, 5), layout="constrained")
+    ax.plot(month_start.astype("datetime64[ns]"), means, marker="o", linewidth=2)
+    ax.set_title(f"Average Score by Month {tag}")
+    ax.set_xlabel("Date"); ax.set_ylabel("Average Score")
+    fig.savefig(OUT_FIGS / f"03_monthly_trend{tag}.png", dpi=150, pil_kwargs=PNG_OPTS)
     plt.close(fig)
+    return pd.DataFrame({"MonthStart": month_start.astype("datetime64[ns]"), score_col: means})
+
+
+def code_stats(codes, values, n_groups):
+    """Per-code mean, count and sample SD via bincount; codes < 0 are skipped."""
+    keep = codes >= 0
+    codes, values = codes[keep], values[keep]
+    count = np.bincount(codes, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(codes, weights=values, minlength=n_groups) / count
+        dev = values - mean[codes]
+        ss = np.bincount(codes, weights=dev * dev, minlength=n_groups)
+        std = np.sqrt(ss / (count - 1))
+    return mean, count, std
 
 
 def plot_observer_bar(df, observer_col, score_col, tag="", min_n=5):
-    stats = (df.groupby(observer_col)
-               .agg(Mean=(score_col, "mean"),
-                    Count=(score_col, "count"),
-                    Std=(score_col, "std"))
-               .reset_index())
+    obs = df[observer_col]
+    mean, count, std = code_stats(obs.cat.codes.to_numpy(), df[score_col].to_numpy(),
+                                  len(obs.cat.categories))
+    stats = pd.DataFrame({observer_col: obs.cat.categories,
+                          "Mean": mean, "Count": count, "Std": std})
     stats = stats[stats["Count"] >= min_n].sort_values("Mean").reset_index(drop=True)
     overall_mean = df[score_col].mean()
     colors = np.where(stats["Mean"] < overall_mean, "tab:blue", "tab:orange")
 
-    fig = plt.figure(figsize=(12, max(5, int(len(stats) * 0.35))))
+    fig, ax = plt.subplots(figsize=(12, max(5, int(len(stats) * 0.35))), layout="constrained")
     x = np.arange(len(stats))
-    plt.bar(x, stats["Mean"], color=colors)
-    plt.axhline(overall_mean, color="gray", linestyle="--", linewidth=1.5,
-                label=f"District Mean = {overall_mean:.2f}")
-    plt.legend()
-    plt.title(f"Average Score by Observer (n ≥ {min_n}) {tag}")
-    plt.xlabel("Observer"); plt.ylabel("Average Score")
-    plt.xticks(x, stats[observer_col], rotation=45, ha="right")
-    for i, row in stats.iterrows():
-        plt.text(i, row["Mean"], f"{row['Mean']:.2f}\n(n={int(row['Count'])})",
-                 ha="center", va="bottom", fontsize=9)
-    plt.ylim(min(3.0, stats["Mean"].min() - 0.1),
-             min(4.05, max(4.0, stats["Mean"].max() + 0.1)))
-    plt.grid(axis="y", alpha=0.25)
-    fig.tight_layout()
-    fig.savefig(OUT_FIGS / f"05_observer_mean_bar{tag}.png", dpi=150)
+    bars = ax.bar(x, stats["Mean"], color=colors)
+    ax.axhline(overall_mean, color="gray", linestyle="--", linewidth=1.5,
+               label=f"District Mean = {overall_mean:.2f}")
+    ax.legend()
+    ax.set_title(f"Average Score by Observer (n ≥ {min_n}) {tag}")
+    ax.set_xlabel("Observer"); ax.set_ylabel("Average Score")
+    ax.set_xticks(x, stats[observer_col], rotation=45, ha="right")
+    ax.bar_label(bars, labels=[f"{m:.2f}\n(n={c})" for m, c
+                               in zip(stats["Mean"].to_numpy(), stats["Count"].to_numpy())],
+                 padding=2, fontsize=9)
+    ax.set_ylim(min(3.0, stats["Mean"].min() - 0.1),
+                min(4.05, max(4.0, stats["Mean"].max() + 0.1)))
+    ax.grid(axis="y", alpha=0.25)
+    fig.savefig(OUT_FIGS / f"05_observer_mean_bar{tag}.png", dpi=150, pil_kwargs=PNG_OPTS)
     plt.close(fig)
 
-    stats.to_csv(OUT_DATA / f"evaluator_stats{tag}.csv", index=False)
+    write_csv(stats, OUT_DATA / f"evaluator_stats{tag}.csv")
+
+
+def plot_pool_context():
+    """Start method for plot workers: a preloaded forkserver where available, else spawn.
+
+    A plain fork is avoided because pyarrow's CSV reader threads may already be running.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["numpy", "pandas", "matplotlib.pyplot"])
+    return ctx
 
 
 def main():
     args = parse_args()
     ensure_dirs()
-    d = load_clean(args.csv, args.date_col, args.score_col,
-                   args.schoolyear_col, args.school_year)
+    d = load_clean_cached(args.csv, args.date_col, args.score_col,
+                          args.schoolyear_col, args.school_year,
+                          extra_cols=(args.observer_col, args.observee_col, args.etype_col))
+    d["EvalGroup"] = make_eval_group(d, args.etype_col)
     tag = f"_{args.school_year.replace('/', '-').replace(' ', '_')}" if args.school_year else ""
 
-    plot_hist(d, args.score_col, tag)
-    plot_box_by_type(d, args.score_col, args.etype_col, tag, min_n=10)
-    plot_monthly_trend(d, args.date_col, args.score_col, tag)
-    plot_observer_bar(d, args.observer_col, args.score_col, tag, min_n=5)
-
-    d.groupby([args.etype_col])[args.score_col].mean().reset_index() \
-        .to_csv(OUT_DATA / f"type_means{tag}.csv", index=False)
-    (d.groupby(["Month", "MonthStart"])[args.score_col].mean().reset_index()
-       .sort_values("MonthStart")
-       .drop(columns=["MonthStart"])
-       .to_csv(OUT_DATA / f"monthly_means{tag}.csv", index=False))
+    # Each chart is independent and only gets the columns it reads.
+    score = args.score_col
+    plots = [(plot_hist, d[[score]], score, tag),
+             (plot_box_by_type, d[["EvalGroup", score]], score, tag, 10),
+             (plot_monthly_trend, d[["MonthStart", score]], args.date_col, score, tag),
+             (plot_observer_bar, d[[args.observer_col, score]], args.observer_col, score, tag, 5)]
+    workers = min(len(plots), os.cpu_count() or 1)
+    if workers > 1 and len(d) >= PLOT_POOL_MIN_ROWS:
+        with ProcessPoolExecutor(workers, mp_context=plot_pool_context()) as ex:
+            jobs = [ex.submit(*plot) for plot in plots]
+            _, _, monthly, _ = [job.result() for job in jobs]
+    else:
+        _, _, monthly, _ = [fn(*plot_args) for fn, *plot_args in plots]
+
+    write_csv(d.groupby([args.etype_col], observed=True)[args.score_col].mean().reset_index(),
+              OUT_DATA / f"type_means{tag}.csv")
+    monthly.insert(0, "Month", monthly.pop("MonthStart").dt.strftime("%Y-%m"))
+    write_csv(monthly, OUT_DATA / f"monthly_means{tag}.csv")
 
     print(f"Saved figures in: {OUT_FIGS.resolve()}")
     print(f"Saved summaries in: {OUT_DATA.resolve()}")